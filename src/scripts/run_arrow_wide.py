@@ -5,7 +5,7 @@ from pathlib import Path
 from textual.app import App, ComposeResult
 from textual.driver import Driver
 from textual.types import CSSPathType
-from textual_fastdatatable import DataTable
+from textual_fastdatatable import ArrowBackend, DataTable
 
 BENCHMARK_DATA = Path(__file__).parent.parent.parent / "tests" / "data"
 
@@ -24,7 +24,8 @@ class ArrowBackendApp(App):
         self.data_path = data_path
 
     def compose(self) -> ComposeResult:
-        yield DataTable(data=self.data_path)
+        backend = ArrowBackend.from_parquet(self.data_path, memory_map=True)
+        yield DataTable(backend=backend)
 
 
 if __name__ == "__main__":
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from pathlib import Path
 
-import pandas as pd
+import pyarrow.parquet as pq
 from textual.app import App, ComposeResult
 from textual.driver import Driver
 from textual.types import CSSPathType
@@ -25,12 +25,11 @@ class BuiltinApp(App):
         self.data_path = data_path
 
     def compose(self) -> ComposeResult:
-        df = pd.read_parquet(self.data_path)
-        rows = [tuple(row) for row in df.itertuples(index=False)]
+        tbl = pq.read_table(str(self.data_path), memory_map=True, pre_buffer=True)
+        rows = list(zip(*[col.to_pylist() for col in tbl.columns]))
         table: DataTable = DataTable()
-        table.add_columns(*[str(col) for col in df.columns])
-        for row in rows:
-            table.add_row(*row, height=1, label=None)
+        table.add_columns(*tbl.column_names)
+        table.add_rows(rows)
         yield table
 
 
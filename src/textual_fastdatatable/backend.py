@@ -1,17 +1,25 @@
 from __future__ import annotations
 
+import os
+import sys
+import weakref
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import suppress
+from importlib.util import find_spec
+from itertools import islice, zip_longest
 from pathlib import Path
 from typing import (
+    TYPE_CHECKING,
     Any,
-    Dict,
+    Callable,
     Generic,
     Iterable,
     Literal,
     Mapping,
     Sequence,
     TypeVar,
+    cast,
 )
 
 import pyarrow as pa
@@ -19,19 +27,27 @@ import pyarrow.compute as pc
 import pyarrow.lib as pal
 import pyarrow.parquet as pq
 import pyarrow.types as pt
+from rich.cells import cell_len
 from rich.console import Console
 
 from textual_fastdatatable.formatter import measure_width
 
 AutoBackendType = Any
 
-try:
-    import polars as pl
-    import polars.datatypes as pld
-except ImportError:
-    _HAS_POLARS = False
-else:
-    _HAS_POLARS = True
+# polars is an optional dependency that is slow to import, so PolarsBackend
+# is only imported when it is used.
+_HAS_POLARS = find_spec("polars") is not None
+
+if TYPE_CHECKING:
+    from textual_fastdatatable.polars_backend import PolarsBackend as PolarsBackend
+
+
+def __getattr__(name: str) -> Any:
+    if name == "PolarsBackend":
+        from textual_fastdatatable.polars_backend import PolarsBackend
+
+        return PolarsBackend
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def create_backend(
@@ -39,18 +55,26 @@ def create_backend(
     max_rows: int | None = None,
     has_header: bool = False,
 ) -> DataTableBackend:
+    factory = _BACKEND_FACTORIES.get(type(data))
+    if factory is not None:
+        return factory(data, max_rows)
     if isinstance(data, pa.Table):
         return ArrowBackend(data, max_rows=max_rows)
     if isinstance(data, pa.RecordBatch):
         return ArrowBackend.from_batches(data, max_rows=max_rows)
-    if _HAS_POLARS and isinstance(data, pl.DataFrame):
+    if _is_polars_dataframe(data):
+        from textual_fastdatatable.polars_backend import PolarsBackend
+
         return PolarsBackend.from_dataframe(data, max_rows=max_rows)
 
-    if isinstance(data, Path) or isinstance(data, str):
+    if isinstance(data, str):
         data = Path(data)
+    if isinstance(data, Path):
         if data.suffix in [".pqt", ".parquet"]:
             return ArrowBackend.from_parquet(data, max_rows=max_rows)
         if _HAS_POLARS:
+            from textual_fastdatatable.polars_backend import PolarsBackend
+
             return PolarsBackend.from_file_path(
                 data, max_rows=max_rows, has_header=has_header
             )
@@ -73,7 +97,103 @@ def create_backend(
     )
 
 
+# below these sizes, starting a thread pool costs more than it saves when
+# measuring column widths
+_PARALLEL_MEASURE_MIN_COLUMNS = 4
+_PARALLEL_MEASURE_MIN_ROWS = 10_000
+# append_rows, drop_row, and update_cell each add chunks to the table; past this
+# many chunks in a column, the table is copied into contiguous chunks
+_MAX_CHUNKS = 64
+
+# exact types that map directly to a backend, checked before the slower
+# isinstance checks in create_backend
+_BACKEND_FACTORIES: dict[type, Callable[[Any, int | None], DataTableBackend]] = {
+    pa.Table: lambda data, max_rows: ArrowBackend(data, max_rows=max_rows),
+    pa.RecordBatch: lambda data, max_rows: ArrowBackend.from_batches(
+        data, max_rows=max_rows
+    ),
+}
+
+
+def _is_polars_dataframe(data: Any) -> bool:
+    # if polars hasn't been imported yet, data can't be a polars DataFrame
+    pl = sys.modules.get("polars")
+    return pl is not None and isinstance(data, pl.DataFrame)
+
+
+# python types that map to a single arrow type, so we can skip arrow's
+# type inference. Only the first value is checked, so the conversion to these
+# types must reject (or infer the same type for) anything else in the column.
+# int is excluded, since a column of ints may also contain floats, which would
+# be truncated if we converted to int64; str is excluded, since converting to
+# string silently accepts bytes, which arrow would otherwise infer as binary.
+_ARROW_TYPES_BY_PY_TYPE: dict[type, pa.DataType] = {
+    bool: pa.bool_(),
+    float: pa.float64(),
+}
+
+
+def _array_from_sequence(values: Sequence[Any]) -> pa.Array | pa.ChunkedArray:
+    if isinstance(values, (list, tuple)):
+        first = next((v for v in values if v is not None), None)
+        arrow_type = _ARROW_TYPES_BY_PY_TYPE.get(type(first))
+        if arrow_type is not None:
+            with suppress(pal.ArrowInvalid, pal.ArrowTypeError):
+                return pa.array(values, type=arrow_type)
+    return pa.array(values)
+
+
+def _dedupe_field_names(names: Sequence[str]) -> list[str] | None:
+    """
+    Returns a copy of names with duplicates renamed, or None if every name
+    is already unique.
+    """
+    if len(set(names)) == len(names):
+        return None
+    seen: set[str] = set()
+    # names are only ever added to seen, so the search for a free name can
+    # resume where the last search for the same name left off, instead of
+    # walking the whole chain of renames again
+    resume_at: dict[str, tuple[str, int]] = {}
+    field_names: list[str] = []
+    for name in names:
+        field, n = resume_at.get(name, (name, 0))
+        while field in seen:
+            field = f"{field}{n}"
+            n += 1
+        seen.add(field)
+        resume_at[name] = (field, n)
+        field_names.append(field)
+    return field_names
+
+
+_CONSOLE: Console | None = None
+
+
+def _get_console() -> Console:
+    """
+    Returns a Console shared by all backends, which is only used to measure
+    cell widths.
+    """
+    global _CONSOLE
+    if _CONSOLE is None:
+        _CONSOLE = Console()
+    return _CONSOLE
+
+
+# names of the str() UDFs registered with arrow, one per input type; arrow's
+# function registry is global, so each only needs to be registered once
+_REGISTERED_UDFS: set[str] = set()
+
+
+def _py_str(_ctx: Any, arr: pa.Array) -> str | pa.Array | pa.ChunkedArray:
+    return pa.array([str(el) for el in arr], type=pa.string())
+
+
 def _is_iterable(item: Any) -> bool:
+    # records are almost always lists or tuples
+    if isinstance(item, (list, tuple)):
+        return True
     try:
         iter(item)
     except TypeError:
@@ -196,16 +316,8 @@ class ArrowBackend(DataTableBackend[pa.Table]):
 
         # Arrow allows duplicate field names, but a table's to_pylist() and
         # to_pydict() methods will drop duplicate-named fields!
-        field_names: list[str] = []
-        renamed = False
-        for field in data.column_names:
-            n = 0
-            while field in field_names:
-                field = f"{field}{n}"
-                renamed = True
-                n += 1
-            field_names.append(field)
-        if renamed:
+        field_names = _dedupe_field_names(data.column_names)
+        if field_names is not None:
             data = data.rename_columns(field_names)
 
         self._source_row_count = data.num_rows
@@ -213,21 +325,34 @@ class ArrowBackend(DataTableBackend[pa.Table]):
             self.data = data.slice(offset=0, length=max_rows)
         else:
             self.data = data
-        self._console = Console()
+        self._console = _get_console()
         self._column_content_widths: list[int] = []
+        # python lists of the columns, keyed by column index
+        self._column_cache: dict[int, list[Any]] = {}
+        # the sort key and a weak reference to the resulting data from the last
+        # call to sort(), so a replaced table isn't kept alive
+        self._last_sort: tuple[Any, weakref.ref[pa.Table]] | None = None
 
     @staticmethod
     def _pydict_from_records(
         records: Sequence[Iterable[Any]], has_header: bool = False
-    ) -> dict[str, list[Any]]:
+    ) -> dict[str, Sequence[Any]]:
         headers = (
-            records[0]
+            list(records[0])
             if has_header
             else [f"f{i}" for i in range(len(list(records[0])))]
         )
-        data = list(map(list, records[1:] if has_header else records))
-        pydict = {header: [row[i] for row in data] for i, header in enumerate(headers)}
-        return pydict
+        start = 1 if has_header else 0
+        if len(records) <= start:
+            return {header: [] for header in headers}
+        # transpose rows into columns in a single pass, without copying the
+        # records to drop the header; short rows are padded with nulls
+        columns: list[Sequence[Any]] = list(zip_longest(*islice(records, start, None)))
+        if len(columns) < len(headers):
+            # no row is as long as the header
+            empty = [None] * (len(records) - start)
+            columns.extend(empty for _ in range(len(headers) - len(columns)))
+        return dict(zip(headers, columns))
 
     @classmethod
     def from_batches(
@@ -238,17 +363,107 @@ class ArrowBackend(DataTableBackend[pa.Table]):
 
     @classmethod
     def from_parquet(
-        cls, path: Path | str, max_rows: int | None = None
+        cls,
+        path: Path | str | pa.NativeFile,
+        max_rows: int | None = None,
+        columns: list[str] | None = None,
+        memory_map: bool = False,
+        pre_buffer: bool = True,
+        use_threads: bool = True,
+        buffer_size: int = 0,
     ) -> "ArrowBackend":
-        tbl = pq.read_table(str(path))
+        """
+        path: a path to a parquet file, or an open pyarrow NativeFile (e.g., from
+            pa.memory_map), which is read without being re-opened.
+        columns: if provided, only the named columns are read from the file.
+        memory_map, pre_buffer, use_threads, buffer_size: passed through to
+            pq.read_table. A nonzero buffer_size reads column chunks through a
+            buffered stream of that size, which can reduce peak memory use on
+            remote filesystems.
+
+        If max_rows is set, only the first max_rows rows are read from the file,
+        so source_data will not contain the rest of the file; source_row_count
+        is still taken from the file's metadata.
+        """
+        source: str | pa.NativeFile = (
+            path if isinstance(path, pa.NativeFile) else str(path)
+        )
+        if max_rows is not None:
+            return cls._from_parquet_head(
+                source,
+                max_rows=max_rows,
+                columns=columns,
+                memory_map=memory_map,
+                pre_buffer=pre_buffer,
+                use_threads=use_threads,
+                buffer_size=buffer_size,
+            )
+        tbl = pq.read_table(
+            source,
+            columns=columns,
+            memory_map=memory_map,
+            pre_buffer=pre_buffer,
+            use_threads=use_threads,
+            buffer_size=buffer_size,
+        )
         return cls(tbl, max_rows=max_rows)
 
+    @classmethod
+    def _from_parquet_head(
+        cls,
+        source: str | pa.NativeFile,
+        max_rows: int,
+        columns: list[str] | None,
+        memory_map: bool,
+        pre_buffer: bool,
+        use_threads: bool,
+        buffer_size: int,
+    ) -> "ArrowBackend":
+        with pq.ParquetFile(
+            source,
+            memory_map=memory_map,
+            pre_buffer=pre_buffer,
+            buffer_size=buffer_size,
+        ) as pf:
+            batches: list[pa.RecordBatch] = []
+            read_rows = 0
+            # stop decoding as soon as we have enough rows
+            for batch in pf.iter_batches(
+                batch_size=max(1, min(max_rows, 65_536)),
+                columns=columns,
+                use_threads=use_threads,
+            ):
+                batches.append(batch)
+                read_rows += batch.num_rows
+                if read_rows >= max_rows:
+                    break
+            if batches:
+                tbl = pa.Table.from_batches(batches)
+            else:
+                # the file has no rows, but we still need its schema
+                tbl = pf.read(columns=columns, use_threads=use_threads)
+            backend = cls(tbl, max_rows=max_rows)
+            backend._source_row_count = pf.metadata.num_rows
+        return backend
+
     @classmethod
     def from_pydict(
-        cls, data: Mapping[str, Sequence[Any]], max_rows: int | None = None
+        cls,
+        data: Mapping[str, Sequence[Any]],
+        max_rows: int | None = None,
+        columns: list[str] | None = None,
     ) -> "ArrowBackend":
+        """
+        columns: if provided, only the named columns are converted to arrow,
+            in the order given.
+        """
+        if columns is not None:
+            data = {name: data[name] for name in columns}
         try:
-            tbl = pa.Table.from_pydict(dict(data))
+            tbl = pa.Table.from_arrays(
+                [_array_from_sequence(values) for values in data.values()],
+                names=list(data.keys()),
+            )
         except (pal.ArrowInvalid, pal.ArrowTypeError):
             # one or more fields has mixed types, like int and
             # string. Cast all to string for safety
@@ -265,12 +480,23 @@ class ArrowBackend(DataTableBackend[pa.Table]):
         records: Sequence[Iterable[Any]],
         has_header: bool = False,
         max_rows: int | None = None,
+        columns: list[str] | None = None,
     ) -> "ArrowBackend":
+        """
+        columns: if provided, only the named columns are converted to arrow,
+            in the order given. Without a header, columns are named f0, f1, ...
+        """
         pydict = cls._pydict_from_records(records, has_header)
-        return cls.from_pydict(pydict, max_rows=max_rows)
+        return cls.from_pydict(pydict, max_rows=max_rows, columns=columns)
 
     @property
     def source_data(self) -> pa.Table:
+        """
+        The table the backend was created with, before max_rows was applied.
+        data is a zero-copy slice of this table, so keeping a reference to it
+        does not duplicate any buffers, but it does keep rows beyond max_rows
+        in memory.
+        """
         return self._source_data
 
     @property
@@ -291,8 +517,21 @@ class ArrowBackend(DataTableBackend[pa.Table]):
 
     @property
     def column_content_widths(self) -> list[int]:
-        if not self._column_content_widths:
-            measurements = [self._measure(arr) for arr in self.data.columns]
+        if not self._column_content_widths and self.data.num_rows == 0:
+            self._column_content_widths = [0] * self.data.num_columns
+        elif not self._column_content_widths:
+            workers = min(os.cpu_count() or 1, self.data.num_columns)
+            if (
+                workers > 1
+                and self.data.num_columns >= _PARALLEL_MEASURE_MIN_COLUMNS
+                and self.data.num_rows >= _PARALLEL_MEASURE_MIN_ROWS
+            ):
+                # arrow's compute kernels release the GIL, so large columns can
+                # be measured in parallel
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    measurements = list(executor.map(self._measure, self.data.columns))
+            else:
+                measurements = [self._measure(arr) for arr in self.data.columns]
             # pc.max returns None for each column without rows; we need to return 0
             # instead.
             self._column_content_widths = [cw or 0 for cw in measurements]
@@ -300,22 +539,53 @@ class ArrowBackend(DataTableBackend[pa.Table]):
         return self._column_content_widths
 
     def get_row_at(self, index: int) -> Sequence[Any]:
-        try:
-            row: Dict[str, Any] = self.data.slice(index, length=1).to_pylist()[0]
-        except OverflowError:
-            return [None for _ in self.columns]
-        else:
-            return list(row.values())
+        if index < 0 or index >= self.data.num_rows:
+            raise IndexError(
+                f"Cannot get row={index} in table with {self.data.num_rows} rows "
+                f"and {self.data.num_columns} cols"
+            )
+        # converting one scalar per column is much cheaper than building a
+        # dict for the row with to_pylist(); columns that were already
+        # converted by get_column_at don't need to be converted again
+        row: list[Any] = []
+        for column_index, column in enumerate(self.data.itercolumns()):
+            cached = self._column_cache.get(column_index)
+            if cached is not None:
+                row.append(cached[index])
+                continue
+            try:
+                row.append(column[index].as_py())
+            except OverflowError:
+                row.append(None)
+        return row
+
+    def _normalize_column_index(self, column_index: int) -> int:
+        # arrow accepts negative indices, but the column cache is keyed by the
+        # positive index
+        num_columns = self.data.num_columns
+        index = column_index + num_columns if column_index < 0 else column_index
+        if not 0 <= index < num_columns:
+            raise IndexError(
+                f"Cannot get column={column_index} in table with {num_columns} cols"
+            )
+        return index
 
     def get_column_at(self, column_index: int) -> list[Any]:
-        try:
-            values = self.data[column_index].to_pylist()
-        except OverflowError:
-            return [None for _ in range(self.row_count)]
-        else:
-            return values
+        column_index = self._normalize_column_index(column_index)
+        if column_index not in self._column_cache:
+            try:
+                values = self.data[column_index].to_pylist()
+            except OverflowError:
+                values = [None for _ in range(self.row_count)]
+            self._column_cache[column_index] = values
+        # copy the cached list so callers can't modify it
+        return list(self._column_cache[column_index])
 
     def get_cell_at(self, row_index: int, column_index: int) -> Any:
+        column_index = self._normalize_column_index(column_index)
+        cached = self._column_cache.get(column_index)
+        if cached is not None:
+            return cached[row_index]
         try:
             value = self.data[column_index][row_index].as_py()
         except OverflowError:
@@ -329,8 +599,7 @@ class ArrowBackend(DataTableBackend[pa.Table]):
         if default is None:
             arr: pa.Array = pa.nulls(self.row_count)
         else:
-            arr = pa.nulls(self.row_count, type=pa.string())
-            arr = arr.fill_null(str(default))
+            arr = pa.repeat(str(default), self.row_count)
 
         self.data = self.data.append_column(label, arr)
         if self._column_content_widths:
@@ -340,36 +609,92 @@ class ArrowBackend(DataTableBackend[pa.Table]):
     def append_rows(self, records: Iterable[Iterable[Any]]) -> list[int]:
         rows = list(records)
         indicies = list(range(self.row_count, self.row_count + len(rows)))
-        records_with_headers = [self.data.column_names, *rows]
-        pydict = self._pydict_from_records(records_with_headers, has_header=True)
-        old_rows = self.data.to_batches()
-        new_rows = pa.RecordBatch.from_pydict(
-            pydict,
+        # transpose the rows and convert each column straight to the type
+        # in the table's schema
+        columns: list[Sequence[Any]] = list(zip_longest(*rows)) or [
+            [] for _ in self.data.column_names
+        ]
+        new_rows = pa.RecordBatch.from_arrays(
+            [
+                pa.array(values, type=field.type)
+                for values, field in zip(columns, self.data.schema)
+            ],
             schema=self.data.schema,
         )
-        self.data = pa.Table.from_batches([*old_rows, new_rows])
-        self._reset_content_widths()
+        # concat_tables only adds the new chunks to each column; it does not
+        # copy the existing data
+        self.data = pa.concat_tables([self.data, pa.Table.from_batches([new_rows])])
+        if self._column_content_widths:
+            # only the new rows can make a column wider
+            self._column_content_widths = [
+                max(width, new_width)
+                for width, new_width in zip(
+                    self._column_content_widths, self._measure_rows(new_rows)
+                )
+            ]
+        self._combine_chunks_if_fragmented()
+        self._column_cache.clear()
         return indicies
 
     def drop_row(self, row_index: int) -> None:
         if row_index < 0 or row_index >= self.row_count:
             raise IndexError(f"Can't drop row {row_index} of {self.row_count}")
-        above = self.data.slice(0, row_index).to_batches()
-        below = self.data.slice(row_index + 1).to_batches()
-        self.data = pa.Table.from_batches([*above, *below])
-        self._reset_content_widths()
-        pass
+        # the widths of boolean, null, and temporal columns are not the widest
+        # value's width, so dropping a row can't make them narrower
+        dropped_widths = (
+            [
+                0
+                if pt.is_boolean(arr.type)
+                or pt.is_null(arr.type)
+                or pt.is_temporal(arr.type)
+                else self._measure(arr)
+                for arr in self.data.slice(row_index, 1).columns
+            ]
+            if self._column_content_widths
+            else []
+        )
+        # slices are zero-copy, so this only rewires chunk references
+        if row_index == 0:
+            self.data = self.data.slice(1)
+        elif row_index == self.row_count - 1:
+            self.data = self.data.slice(0, row_index)
+        else:
+            self.data = pa.concat_tables(
+                [self.data.slice(0, row_index), self.data.slice(row_index + 1)]
+            )
+        # the widths only need to be measured again if the dropped row was
+        # (one of) the widest in any column
+        if any(
+            0 < dropped >= width
+            for dropped, width in zip(dropped_widths, self._column_content_widths)
+        ):
+            self._reset_content_widths()
+        self._combine_chunks_if_fragmented()
+        self._column_cache.clear()
 
     def update_cell(self, row_index: int, column_index: int, value: Any) -> None:
+        column_index = self._normalize_column_index(column_index)
         column = self.data.column(column_index)
-        pycolumn = self.get_column_at(column_index=column_index)
-        pycolumn[row_index] = value
+        if row_index < 0:
+            row_index += len(column)
+        if not 0 <= row_index < len(column):
+            raise IndexError(f"Row index {row_index} out of range")
         new_type = pa.string() if pt.is_null(column.type) else column.type
+        # splice the new value between zero-copy slices of the existing column,
+        # so only the updated cell is converted from Python
+        before, after = column.slice(0, row_index), column.slice(row_index + 1)
+        if new_type != column.type:
+            before, after = before.cast(new_type), after.cast(new_type)
+        chunks = [*before.chunks, pa.array([value], type=new_type), *after.chunks]
+        new_column = pa.chunked_array([c for c in chunks if len(c)], type=new_type)
         self.data = self.data.set_column(
             column_index,
             self.data.column_names[column_index],
-            pa.array(pycolumn, type=new_type),
+            new_column.combine_chunks()
+            if new_column.num_chunks > _MAX_CHUNKS
+            else new_column,
         )
+        self._column_cache.pop(column_index, None)
         if self._column_content_widths:
             self._column_content_widths[column_index] = max(
                 measure_width(value, self._console),
@@ -384,31 +709,74 @@ class ArrowBackend(DataTableBackend[pa.Table]):
         by: list[tuple] sorts the table by the named column(s) with the directions
             indicated.
         """
+        key = by if isinstance(by, str) else tuple(by)
+        if self._is_sorted_by(key):
+            return
         self.data = self.data.sort_by(by)
+        self._column_cache.clear()
+        self._last_sort = (key, weakref.ref(self.data))
+
+    def _is_sorted_by(self, key: Any) -> bool:
+        # data is only replaced when it changes, so if it is still the table
+        # returned by the last sort, sorting again by the same key is a no-op
+        return (
+            self._last_sort is not None
+            and self._last_sort[0] == key
+            and self._last_sort[1]() is self.data
+        )
 
     def _reset_content_widths(self) -> None:
         self._column_content_widths = []
 
+    def _combine_chunks_if_fragmented(self) -> None:
+        # slicing, indexing, and converting a column all get slower with the
+        # number of chunks; combining is a full copy, so only do it occasionally
+        if any(col.num_chunks > _MAX_CHUNKS for col in self.data.itercolumns()):
+            self.data = self.data.combine_chunks()
+
+    def _measure_rows(self, rows: pa.Table | pa.RecordBatch) -> list[int]:
+        return [self._measure(arr) or 0 for arr in rows.columns]
+
     def _measure(self, arr: pa._PandasConvertible) -> int:
+        if len(arr) == 0:
+            return 0
         # with some types we can measure the width more efficiently
         if pt.is_boolean(arr.type):
             return 7
         elif pt.is_null(arr.type):
             return 0
+        elif pt.is_dictionary(arr.type):
+            # every value is in the dictionary, which is usually much smaller
+            # than the column
+            chunks = (
+                arr.chunks
+                if isinstance(arr, pa.ChunkedArray)
+                else [cast(pa.Array, arr)]
+            )
+            return max(
+                (self._measure(chunk.dictionary) or 0 for chunk in chunks),
+                default=0,
+            )
         elif (
             pt.is_integer(arr.type)
             or pt.is_floating(arr.type)
             or pt.is_decimal(arr.type)
         ):
+            # a single fused kernel finds both extremes in one pass, skipping
+            # nulls (which are not rendered as numbers)
+            min_max = pc.min_max(arr)
             try:
-                col_max = pc.max(arr.fill_null(0)).as_py()
+                col_max = min_max["max"].as_py()
             except OverflowError:
                 col_max = 1000
             try:
-                col_min = pc.min(arr.fill_null(0)).as_py()
+                col_min = min_max["min"].as_py()
             except OverflowError:
                 col_min = 0
-            return max([measure_width(el, self._console) for el in [col_max, col_min]])
+            return max(
+                measure_width(col_max, self._console),
+                measure_width(col_min, self._console),
+            )
         elif pt.is_temporal(arr.type):
             try:
                 value = arr.drop_null()[0].as_py()
@@ -419,248 +787,88 @@ class ArrowBackend(DataTableBackend[pa.Table]):
 
         # for everything else, we need to compute it
 
-        try:
-            arr = arr.cast(
-                pa.string(),
-                safe=False,
+        # string columns are measured as they are; casting them to large_string
+        # would copy the offsets buffer
+        if pt.is_string(arr.type) or pt.is_large_string(arr.type):
+            pass
+        elif (
+            pt.is_binary(arr.type)
+            or pt.is_large_binary(arr.type)
+            or pt.is_fixed_size_binary(arr.type)
+            or pt.is_binary_view(arr.type)
+        ):
+            # binary values are rendered with str(), and casting them to
+            # large_string doesn't check that they are valid utf8
+            arr = self._str_with_python(arr)
+        else:
+            try:
+                # large_string has 64-bit offsets, so very large columns can't
+                # overflow the cast
+                as_str = arr.cast(
+                    pa.large_string(),
+                    safe=False,
+                )
+                # the unsafe cast doesn't check its output, but the rest of
+                # this method needs valid utf8
+                as_str.validate(full=True)
+            except (pal.ArrowNotImplementedError, pal.ArrowInvalid):
+                arr = self._str_with_python(arr)
+            else:
+                arr = as_str
+        # A string never takes up more cells than it has bytes, and the byte
+        # lengths can be read straight from the offsets buffer. Measuring the
+        # longest string gives a lower bound on the width, and only strings with
+        # more bytes than that bound need to be decoded. For ascii columns, the
+        # bound is exact and nothing else is decoded.
+        byte_lengths = pc.binary_length(arr)
+        max_bytes: int = pc.max(byte_lengths).as_py() or 0
+        if max_bytes == 0:
+            return 0
+        longest: str = arr[pc.index(byte_lengths, max_bytes).as_py()].as_py()
+        width = max(len(longest), cell_len(longest))
+        if width >= max_bytes:
+            return width
+        candidates_mask = pc.greater(byte_lengths, width)
+        arr = arr.filter(candidates_mask)
+        byte_lengths = byte_lengths.filter(candidates_mask)
+        lengths = pc.utf8_length(arr)
+        width = max(width, pc.max(lengths).as_py() or 0)
+        # utf8_length counts code points, but wide characters (like CJK) take
+        # up two cells in a terminal, so non-ascii strings (with more bytes than
+        # code points) that have more bytes than the current width could be
+        # wider, and only those are measured in python.
+        candidates = arr.filter(
+            pc.and_(
+                pc.greater(byte_lengths, lengths),
+                pc.greater(byte_lengths, width),
             )
-        except (pal.ArrowNotImplementedError, pal.ArrowInvalid):
+        )
+        return max([width, *(cell_len(s) for s in candidates.to_pylist())])
 
-            def py_str(_ctx: Any, arr: pa.Array) -> str | pa.Array | pa.ChunkedArray:
-                return pa.array([str(el) for el in arr], type=pa.string())
+    @classmethod
+    def _str_with_python(cls, arr: pa._PandasConvertible) -> pa._PandasConvertible:
+        try:
+            # nested types can't be cast, but one bulk conversion to Python is
+            # much faster than a UDF that stringifies each Arrow scalar
+            return pa.array(
+                [None if el is None else str(el) for el in arr.to_pylist()],
+                type=pa.large_string(),
+            )
+        except OverflowError:
+            return cls._str_with_udf(arr)
 
-            udf_name = f"tfdt_pystr_{arr.type}"
+    @staticmethod
+    def _str_with_udf(arr: pa._PandasConvertible) -> pa._PandasConvertible:
+        udf_name = f"tfdt_pystr_{arr.type}"
+        if udf_name not in _REGISTERED_UDFS:
             with suppress(pal.ArrowKeyError):  # already registered
                 pc.register_scalar_function(
-                    py_str,
+                    _py_str,
                     function_name=udf_name,
                     function_doc={"summary": "str", "description": "built-in str"},
                     in_types={"arr": arr.type},
                     out_type=pa.string(),
                 )
+            _REGISTERED_UDFS.add(udf_name)
 
-            arr = pc.call_function(udf_name, [arr])
-        try:
-            width: int = pc.max(pc.utf8_length(arr.fill_null("")).fill_null(0)).as_py()
-        except OverflowError:
-            width = 10
-        return width
-
-
-if _HAS_POLARS:
-
-    class PolarsBackend(DataTableBackend[pl.DataFrame]):
-        @classmethod
-        def from_file_path(
-            cls, path: Path, max_rows: int | None = None, has_header: bool = True
-        ) -> "PolarsBackend":
-            if path.suffix in [".arrow", ".feather"]:
-                tbl = pl.read_ipc(path)
-            elif path.suffix == ".arrows":
-                tbl = pl.read_ipc_stream(path)
-            elif path.suffix == ".json":
-                tbl = pl.read_json(path)
-            elif path.suffix == ".csv":
-                tbl = pl.read_csv(path, has_header=has_header)
-            else:
-                raise TypeError(
-                    f"Dont know how to load file type {path.suffix} for {path}"
-                )
-            return cls(tbl, max_rows=max_rows)
-
-        @classmethod
-        def from_pydict(
-            cls, pydict: Mapping[str, Sequence[Any]], max_rows: int | None = None
-        ) -> "PolarsBackend":
-            return cls(pl.from_dict(pydict), max_rows=max_rows)
-
-        @classmethod
-        def from_dataframe(
-            cls, frame: pl.DataFrame, max_rows: int | None = None
-        ) -> "PolarsBackend":
-            return cls(frame, max_rows=max_rows)
-
-        def __init__(self, data: pl.DataFrame, max_rows: int | None = None) -> None:
-            self._source_data = data
-
-            # Arrow allows duplicate field names, but a table's to_pylist() and
-            # to_pydict() methods will drop duplicate-named fields!
-            field_names: list[str] = []
-            for field in data.columns:
-                n = 0
-                while field in field_names:
-                    field = f"{field}{n}"
-                    n += 1
-                field_names.append(field)
-            data.columns = field_names
-
-            self._source_row_count = len(data)
-            if max_rows is not None and max_rows < self._source_row_count:
-                self.data = data.slice(offset=0, length=max_rows)
-            else:
-                self.data = data
-            self._console = Console()
-            self._column_content_widths: list[int] = []
-
-        @property
-        def source_data(self) -> pl.DataFrame:
-            return self._source_data
-
-        @property
-        def source_row_count(self) -> int:
-            return self._source_row_count
-
-        @property
-        def row_count(self) -> int:
-            return len(self.data)
-
-        @property
-        def column_count(self) -> int:
-            return len(self.data.columns)
-
-        @property
-        def columns(self) -> Sequence[str]:
-            return self.data.columns
-
-        def get_row_at(self, index: int) -> Sequence[Any]:
-            if index < 0 or index >= len(self.data):
-                raise IndexError(
-                    f"Cannot get row={index} in table with {len(self.data)} rows "
-                    f"and {len(self.data.columns)} cols"
-                )
-            return list(self.data.slice(index, length=1).to_dicts()[0].values())
-
-        def get_column_at(self, column_index: int) -> Sequence[Any]:
-            if column_index < 0 or column_index >= len(self.data.columns):
-                raise IndexError(
-                    f"Cannot get column={column_index} in table with {len(self.data)} "
-                    f"rows and {len(self.data.columns)} cols."
-                )
-            return list(self.data.to_series(column_index))
-
-        def get_cell_at(self, row_index: int, column_index: int) -> Any:
-            if (
-                row_index >= len(self.data)
-                or row_index < 0
-                or column_index < 0
-                or column_index >= len(self.data.columns)
-            ):
-                raise IndexError(
-                    f"Cannot get cell at row={row_index} col={column_index} in table "
-                    f"with {len(self.data)} rows and {len(self.data.columns)} cols"
-                )
-            return self.data.to_series(column_index)[row_index]
-
-        def drop_row(self, row_index: int) -> None:
-            if row_index < 0 or row_index >= self.row_count:
-                raise IndexError(f"Can't drop row {row_index} of {self.row_count}")
-            above = self.data.slice(0, row_index)
-            below = self.data.slice(row_index + 1)
-            self.data = pl.concat([above, below])
-            self._reset_content_widths()
-
-        def append_rows(self, records: Iterable[Iterable[Any]]) -> list[int]:
-            rows_to_add = pl.from_dicts(
-                [dict(zip(self.data.columns, row)) for row in records]
-            )
-            indicies = list(range(self.row_count, self.row_count + len(rows_to_add)))
-            self.data = pl.concat([self.data, rows_to_add])
-            self._reset_content_widths()
-            return indicies
-
-        def append_column(self, label: str, default: Any | None = None) -> int:
-            """
-            Returns column index
-            """
-            self.data = self.data.with_columns(
-                pl.Series([default])
-                .extend_constant(default, self.row_count - 1)
-                .alias(label)
-            )
-            if self._column_content_widths:
-                self._column_content_widths.append(
-                    measure_width(default, self._console)
-                )
-            return len(self.data.columns) - 1
-
-        def _reset_content_widths(self) -> None:
-            self._column_content_widths = []
-
-        def update_cell(self, row_index: int, column_index: int, value: Any) -> None:
-            if row_index >= len(self.data) or column_index >= len(self.data.columns):
-                raise IndexError(
-                    f"Cannot update cell at row={row_index} col={column_index} in "
-                    f"table with {len(self.data)} rows and "
-                    f"{len(self.data.columns)} cols"
-                )
-            col_name = self.data.columns[column_index]
-            self.data = self.data.with_columns(
-                self.data.to_series(column_index)
-                .scatter(row_index, value)
-                .alias(col_name)
-            )
-            if self._column_content_widths:
-                self._column_content_widths[column_index] = max(
-                    measure_width(value, self._console),
-                    self._column_content_widths[column_index],
-                )
-
-        @property
-        def column_content_widths(self) -> list[int]:
-            if not self._column_content_widths:
-                measurements = [
-                    self._measure(self.data[arr]) for arr in self.data.columns
-                ]
-                # pc.max returns None for each column without rows; we need to return 0
-                # instead.
-                self._column_content_widths = [cw or 0 for cw in measurements]
-
-            return self._column_content_widths
-
-        def _measure(self, arr: pl.Series) -> int:
-            # with some types we can measure the width more efficiently
-            dtype = arr.dtype
-            if dtype == pld.Categorical():
-                return self._measure(arr.cat.get_categories())
-
-            if dtype.is_decimal() or dtype.is_float() or dtype.is_integer():
-                col_max = arr.max()
-                col_min = arr.min()
-                return max(
-                    [measure_width(el, self._console) for el in [col_max, col_min]]
-                )
-            if dtype.is_temporal():
-                try:
-                    value = arr.drop_nulls()[0]
-                except IndexError:
-                    return 0
-                else:
-                    return measure_width(value, self._console)
-            if dtype.is_(pld.Boolean()):
-                return 7
-
-            # for everything else, we need to compute it
-
-            arr = arr.cast(
-                pl.Utf8(),
-                strict=False,
-            )
-            width = arr.fill_null("<null>").str.len_chars().max()
-            assert isinstance(width, int)
-            return width
-
-        def sort(
-            self, by: list[tuple[str, Literal["ascending", "descending"]]] | str
-        ) -> None:
-            """
-            by: str sorts table by the data in the column with that name (asc).
-            by: list[tuple] sorts the table by the named column(s) with the directions
-                indicated.
-            """
-            if isinstance(by, str):
-                cols = [by]
-                typs = [False]
-            else:
-                cols = [x for x, _ in by]
-                typs = [x == "descending" for _, x in by]
-            self.data = self.data.sort(cols, descending=typs)
+        return pc.call_function(udf_name, [arr])
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from datetime import date, datetime, time, timedelta
 from decimal import Decimal
+from functools import lru_cache
 from typing import cast
 
 from rich.align import Align
@@ -67,5 +68,30 @@ def cell_formatter(
 
 
 def measure_width(obj: object, console: Console) -> int:
+    # only cache types where equal values always render the same way; e.g.,
+    # Decimal("1.0") == Decimal("1.00") and 0.0 == -0.0, but they have
+    # different widths
+    if type(obj) in _CACHEABLE_TYPES:
+        # the measurement is clamped to the console's width, and ints are
+        # formatted with the current locale's separators, so both are part of
+        # the cache key
+        formatted = f"{obj:n}" if type(obj) is int else None
+        return _cached_measure_width(obj, console, console.width, formatted)
+    return _measure_width(obj, console)
+
+
+def _measure_width(obj: object, console: Console) -> int:
     renderable = cell_formatter(obj, null_rep=Text(""))
     return console.measure(renderable).maximum
+
+
+# the same values (small ints, labels) are measured over and over
+_CACHEABLE_TYPES = (int, str, bool)
+
+
+# typed=True keeps True and 1 (which hash the same) apart
+@lru_cache(maxsize=4096, typed=True)
+def _cached_measure_width(
+    obj: object, console: Console, console_width: int, formatted: str | None
+) -> int:
+    return _measure_width(obj, console)
@@ -0,0 +1,292 @@
+from __future__ import annotations
+
+import weakref
+from itertools import zip_longest
+from pathlib import Path
+from typing import Any, Iterable, Literal, Mapping, Sequence
+
+import polars as pl
+import polars.datatypes as pld
+
+from textual_fastdatatable.backend import (
+    DataTableBackend,
+    _dedupe_field_names,
+    _get_console,
+)
+from textual_fastdatatable.formatter import measure_width
+
+
+class PolarsBackend(DataTableBackend[pl.DataFrame]):
+    @classmethod
+    def from_file_path(
+        cls, path: Path, max_rows: int | None = None, has_header: bool = True
+    ) -> "PolarsBackend":
+        if path.suffix in [".arrow", ".feather"]:
+            tbl = pl.read_ipc(path)
+        elif path.suffix == ".arrows":
+            tbl = pl.read_ipc_stream(path)
+        elif path.suffix == ".json":
+            tbl = pl.read_json(path)
+        elif path.suffix == ".csv":
+            tbl = pl.read_csv(path, has_header=has_header)
+        else:
+            raise TypeError(f"Dont know how to load file type {path.suffix} for {path}")
+        return cls(tbl, max_rows=max_rows)
+
+    @classmethod
+    def from_pydict(
+        cls, pydict: Mapping[str, Sequence[Any]], max_rows: int | None = None
+    ) -> "PolarsBackend":
+        return cls(pl.from_dict(pydict), max_rows=max_rows)
+
+    @classmethod
+    def from_dataframe(
+        cls, frame: pl.DataFrame, max_rows: int | None = None
+    ) -> "PolarsBackend":
+        return cls(frame, max_rows=max_rows)
+
+    def __init__(self, data: pl.DataFrame, max_rows: int | None = None) -> None:
+        self._source_data = data
+
+        # Arrow allows duplicate field names, but a table's to_pylist() and
+        # to_pydict() methods will drop duplicate-named fields!
+        field_names = _dedupe_field_names(data.columns)
+        if field_names is not None:
+            data.columns = field_names
+
+        self._source_row_count = len(data)
+        if max_rows is not None and max_rows < self._source_row_count:
+            self.data = data.slice(offset=0, length=max_rows)
+        else:
+            self.data = data
+        self._console = _get_console()
+        self._column_content_widths: list[int] = []
+        # python lists of the columns, keyed by column index
+        self._column_cache: dict[int, list[Any]] = {}
+        # the sort key and a weak reference to the resulting data from the last
+        # call to sort(), so a replaced table isn't kept alive
+        self._last_sort: tuple[Any, weakref.ref[pl.DataFrame]] | None = None
+
+    @property
+    def source_data(self) -> pl.DataFrame:
+        return self._source_data
+
+    @property
+    def source_row_count(self) -> int:
+        return self._source_row_count
+
+    @property
+    def row_count(self) -> int:
+        return len(self.data)
+
+    @property
+    def column_count(self) -> int:
+        return self.data.width
+
+    @property
+    def columns(self) -> Sequence[str]:
+        return self.data.columns
+
+    def get_row_at(self, index: int) -> Sequence[Any]:
+        if index < 0 or index >= len(self.data):
+            raise IndexError(
+                f"Cannot get row={index} in table with {len(self.data)} rows "
+                f"and {len(self.data.columns)} cols"
+            )
+        return list(self.data.row(index))
+
+    def get_column_at(self, column_index: int) -> Sequence[Any]:
+        if column_index < 0 or column_index >= len(self.data.columns):
+            raise IndexError(
+                f"Cannot get column={column_index} in table with {len(self.data)} "
+                f"rows and {len(self.data.columns)} cols."
+            )
+        if column_index not in self._column_cache:
+            self._column_cache[column_index] = self.data.to_series(
+                column_index
+            ).to_list()
+        # copy the cached list so callers can't modify it
+        return list(self._column_cache[column_index])
+
+    def get_cell_at(self, row_index: int, column_index: int) -> Any:
+        if (
+            row_index >= len(self.data)
+            or row_index < 0
+            or column_index < 0
+            or column_index >= len(self.data.columns)
+        ):
+            raise IndexError(
+                f"Cannot get cell at row={row_index} col={column_index} in table "
+                f"with {len(self.data)} rows and {len(self.data.columns)} cols"
+            )
+        cached = self._column_cache.get(column_index)
+        if cached is not None:
+            return cached[row_index]
+        return self.data.to_series(column_index)[row_index]
+
+    def drop_row(self, row_index: int) -> None:
+        if row_index < 0 or row_index >= self.row_count:
+            raise IndexError(f"Can't drop row {row_index} of {self.row_count}")
+        # the widths of boolean, null, and temporal columns are not the widest
+        # value's width, so dropping a row can't make them narrower
+        dropped_row = self.data.slice(row_index, 1)
+        dropped_widths = (
+            [
+                0
+                if series.dtype.is_temporal()
+                or series.dtype in (pld.Boolean(), pld.Null())
+                else self._measure(series)
+                for series in dropped_row.get_columns()
+            ]
+            if self._column_content_widths
+            else []
+        )
+        above = self.data.slice(0, row_index)
+        below = self.data.slice(row_index + 1)
+        self.data = pl.concat([above, below])
+        # the widths only need to be measured again if the dropped row was
+        # (one of) the widest in any column
+        if any(
+            0 < dropped_width >= width
+            for dropped_width, width in zip(dropped_widths, self._column_content_widths)
+        ):
+            self._reset_content_widths()
+        self._column_cache.clear()
+
+    def append_rows(self, records: Iterable[Iterable[Any]]) -> list[int]:
+        # build the new rows column-by-column with the existing schema, instead
+        # of inferring it from one dict per row
+        rows_to_add = pl.DataFrame(
+            dict(zip(self.data.columns, zip_longest(*records))),
+            schema=self.data.schema,
+        )
+        indicies = list(range(self.row_count, self.row_count + len(rows_to_add)))
+        self.data = pl.concat([self.data, rows_to_add], rechunk=False)
+        if self._column_content_widths:
+            # only the new rows can make a column wider
+            self._column_content_widths = [
+                max(width, new_width)
+                for width, new_width in zip(
+                    self._column_content_widths, self._measure_rows(rows_to_add)
+                )
+            ]
+        self._column_cache.clear()
+        return indicies
+
+    def append_column(self, label: str, default: Any | None = None) -> int:
+        """
+        Returns column index
+        """
+        self.data = self.data.with_columns(
+            pl.Series([default])
+            .extend_constant(default, self.row_count - 1)
+            .alias(label)
+        )
+        if self._column_content_widths:
+            self._column_content_widths.append(measure_width(default, self._console))
+        return len(self.data.columns) - 1
+
+    def _reset_content_widths(self) -> None:
+        self._column_content_widths = []
+
+    def update_cell(self, row_index: int, column_index: int, value: Any) -> None:
+        if column_index < 0:
+            # the column cache is keyed by the positive index
+            column_index += len(self.data.columns)
+        if (
+            row_index >= len(self.data)
+            or column_index < 0
+            or column_index >= len(self.data.columns)
+        ):
+            raise IndexError(
+                f"Cannot update cell at row={row_index} col={column_index} in "
+                f"table with {len(self.data)} rows and "
+                f"{len(self.data.columns)} cols"
+            )
+        col_name = self.data.columns[column_index]
+        self.data = self.data.with_columns(
+            self.data.to_series(column_index).scatter(row_index, value).alias(col_name)
+        )
+        self._column_cache.pop(column_index, None)
+        if self._column_content_widths:
+            self._column_content_widths[column_index] = max(
+                measure_width(value, self._console),
+                self._column_content_widths[column_index],
+            )
+
+    @property
+    def column_content_widths(self) -> list[int]:
+        if not self._column_content_widths and len(self.data) == 0:
+            self._column_content_widths = [0] * len(self.data.columns)
+        elif not self._column_content_widths:
+            measurements = [self._measure(self.data[arr]) for arr in self.data.columns]
+            # pc.max returns None for each column without rows; we need to return 0
+            # instead.
+            self._column_content_widths = [cw or 0 for cw in measurements]
+
+        return self._column_content_widths
+
+    def _measure_rows(self, rows: pl.DataFrame) -> list[int]:
+        return [self._measure(rows[arr]) or 0 for arr in rows.columns]
+
+    def _measure(self, arr: pl.Series) -> int:
+        if len(arr) == 0:
+            return 0
+        # with some types we can measure the width more efficiently
+        dtype = arr.dtype
+        if dtype == pld.Categorical():
+            return self._measure(arr.cat.get_categories())
+
+        if dtype.is_decimal() or dtype.is_float() or dtype.is_integer():
+            col_max = arr.max()
+            col_min = arr.min()
+            return max([measure_width(el, self._console) for el in [col_max, col_min]])
+        if dtype.is_temporal():
+            try:
+                value = arr.drop_nulls()[0]
+            except IndexError:
+                return 0
+            else:
+                return measure_width(value, self._console)
+        if dtype.is_(pld.Boolean()):
+            return 7
+
+        # for everything else, we need to compute it
+
+        arr = arr.cast(
+            pl.Utf8(),
+            strict=False,
+        )
+        width = arr.fill_null("<null>").str.len_chars().max()
+        assert isinstance(width, int)
+        return width
+
+    def sort(
+        self, by: list[tuple[str, Literal["ascending", "descending"]]] | str
+    ) -> None:
+        """
+        by: str sorts table by the data in the column with that name (asc).
+        by: list[tuple] sorts the table by the named column(s) with the directions
+            indicated.
+        """
+        key = by if isinstance(by, str) else tuple(by)
+        if self._is_sorted_by(key):
+            return
+        if isinstance(by, str):
+            cols = [by]
+            typs = [False]
+        else:
+            cols = [x for x, _ in by]
+            typs = [x == "descending" for _, x in by]
+        self.data = self.data.sort(cols, descending=typs)
+        self._column_cache.clear()
+        self._last_sort = (key, weakref.ref(self.data))
+
+    def _is_sorted_by(self, key: Any) -> bool:
+        # data is only replaced when it changes, so if it is still the frame
+        # returned by the last sort, sorting again by the same key is a no-op
+        return (
+            self._last_sort is not None
+            and self._last_sort[0] == key
+            and self._last_sort[1]() is self.data
+        )
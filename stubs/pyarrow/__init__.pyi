@@ -25,6 +25,7 @@ def float64() -> DataType: ...
 def date32() -> DataType: ...
 def date64() -> DataType: ...
 def binary(length: int = -1) -> DataType: ...
+def binary_view() -> DataType: ...
 def large_binary() -> DataType: ...
 def large_string() -> DataType: ...
 def month_day_nano_interval() -> DataType: ...
@@ -36,14 +37,30 @@ def timestamp(
 def duration(unit: Literal["s", "ms", "us", "ns"]) -> DataType: ...
 
 class MemoryPool: ...
-class Schema: ...
-class Field: ...
-class NativeFile: ...
+
+class Field:
+    @property
+    def type(self) -> DataType: ...  # noqa: A003
+
+class Schema:
+    def __iter__(self) -> Iterator[Field]: ...
+
+N = TypeVar("N", bound="NativeFile")
+
+class NativeFile:
+    def __enter__(self: N) -> N: ...
+    def __exit__(self, *args: Any) -> None: ...
+    def close(self) -> None: ...
+
+class MemoryMappedFile(NativeFile): ...
 class MonthDayNano: ...
 
 class Scalar:
     def as_py(self) -> Any: ...
 
+class StructScalar(Scalar):
+    def __getitem__(self, key: int | str) -> Scalar: ...
+
 A = TypeVar("A", bound="_PandasConvertible")
 
 class _PandasConvertible:
@@ -57,12 +74,29 @@ class _PandasConvertible:
     ) -> A: ...
     def __getitem__(self, index: int) -> Scalar: ...
     def __iter__(self) -> Any: ...
+    def __len__(self) -> int: ...
+    def slice(self: A, offset: int = 0, length: int | None = None) -> A: ...  # noqa: A003
     def to_pylist(self) -> list[Any]: ...
     def fill_null(self: A, fill_value: Any) -> A: ...
     def drop_null(self: A) -> A: ...
+    def validate(self, *, full: bool = False) -> None: ...
+    def dictionary_encode(self: A, null_encoding: str = "mask") -> A: ...
+    def filter(  # noqa: A003
+        self: A,
+        mask: _PandasConvertible,
+        null_selection_behavior: Literal["drop", "emit_null"] = "drop",
+    ) -> A: ...
 
-class Array(_PandasConvertible): ...
-class ChunkedArray(_PandasConvertible): ...
+class Array(_PandasConvertible):
+    @property
+    def dictionary(self) -> Array: ...
+
+class ChunkedArray(_PandasConvertible):
+    @property
+    def chunks(self) -> list[Array]: ...
+    @property
+    def num_chunks(self) -> int: ...
+    def combine_chunks(self, memory_pool: MemoryPool | None = None) -> Array: ...
 
 class StructArray(Array):
     def flatten(self, memory_pool: MemoryPool | None = None) -> list[Array]: ...
@@ -129,6 +163,9 @@ class Table(_Tabular):
         batches: Iterable[RecordBatch],
         schema: Schema | None = None,
     ) -> "Table": ...
+    def column(self, i: int | str) -> ChunkedArray: ...
+    def combine_chunks(self, memory_pool: MemoryPool | None = None) -> Table: ...
+    def itercolumns(self) -> Iterator[ChunkedArray]: ...
     def to_batches(self) -> list[RecordBatch]: ...
 
 def array(
@@ -140,14 +177,24 @@ def array(
     safe: bool = True,
     memory_pool: MemoryPool | None = None,
 ) -> Array | ChunkedArray: ...
+def chunked_array(
+    arrays: Iterable[Array | ChunkedArray],
+    type: DataType | None = None,  # noqa: A002
+) -> ChunkedArray: ...
 def concat_arrays(
     arrays: Iterable[Array], memory_pool: MemoryPool | None = None
 ) -> Array: ...
+def concat_tables(
+    tables: Iterable[Table],
+    memory_pool: MemoryPool | None = None,
+    promote_options: Literal["none", "default", "permissive"] = "none",
+) -> Table: ...
 def nulls(
     size: int,
     type: DataType | None = None,  # noqa: A002
     memory_pool: MemoryPool | None = None,
 ) -> Array: ...
+def repeat(value: Any, size: int, memory_pool: MemoryPool | None = None) -> Array: ...
 def table(
     data: pd.DataFrame
     | Mapping[str, _PandasConvertible | list]
@@ -157,4 +204,5 @@ def table(
     metadata: Mapping | None = None,
     nthreads: int | None = None,
 ) -> Table: ...
+def memory_map(path: str, mode: Literal["r", "r+", "w"] = "r") -> MemoryMappedFile: ...
 def set_timezone_db_path(path: str) -> None: ...
@@ -3,7 +3,7 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Any, Callable, Literal
 
-from . import DataType, MemoryPool, Scalar, _PandasConvertible
+from . import DataType, MemoryPool, Scalar, StructScalar, _PandasConvertible
 
 class Expression: ...
 class ScalarAggregateOptions: ...
@@ -38,6 +38,41 @@ def min(  # noqa: A001
     options: ScalarAggregateOptions | None = None,
     memory_pool: MemoryPool | None = None,
 ) -> Scalar: ...
+def min_max(
+    array: _PandasConvertible,
+    /,
+    *,
+    skip_nulls: bool = True,
+    min_count: int = 1,
+    options: ScalarAggregateOptions | None = None,
+    memory_pool: MemoryPool | None = None,
+) -> StructScalar: ...
+def and_(
+    x: _PandasConvertible,
+    y: _PandasConvertible,
+    /,
+    *,
+    memory_pool: MemoryPool | None = None,
+) -> _PandasConvertible: ...
+def greater(
+    x: _PandasConvertible,
+    y: _PandasConvertible | int,
+    /,
+    *,
+    memory_pool: MemoryPool | None = None,
+) -> _PandasConvertible: ...
+def binary_length(
+    strings: _PandasConvertible, /, *, memory_pool: MemoryPool | None = None
+) -> _PandasConvertible: ...
+def index(
+    data: _PandasConvertible,
+    /,
+    value: Any,
+    start: int | None = None,
+    end: int | None = None,
+    *,
+    memory_pool: MemoryPool | None = None,
+) -> Scalar: ...
 def utf8_length(
     strings: _PandasConvertible, /, *, memory_pool: MemoryPool | None = None
 ) -> _PandasConvertible: ...
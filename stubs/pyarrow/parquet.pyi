@@ -1,13 +1,50 @@
 from __future__ import annotations
 
-from typing import Any, BinaryIO, Literal
+from typing import Any, BinaryIO, Iterator, Literal
 
-from . import NativeFile, Schema, Table
+from . import NativeFile, RecordBatch, Schema, Table
 from .compute import Expression
 from .dataset import Partitioning
 from .fs import FileSystem
 
-class FileMetaData: ...
+class FileMetaData:
+    @property
+    def num_rows(self) -> int: ...
+
+class ParquetFile:
+    def __init__(
+        self,
+        source: str | NativeFile | BinaryIO,
+        *,
+        metadata: FileMetaData | None = None,
+        common_metadata: FileMetaData | None = None,
+        read_dictionary: list | None = None,
+        memory_map: bool = False,
+        buffer_size: int = 0,
+        pre_buffer: bool = False,
+        coerce_int96_timestamp_unit: str | None = None,
+        decryption_properties: Any | None = None,
+        thrift_string_size_limit: int | None = None,
+        thrift_container_size_limit: int | None = None,
+    ) -> None: ...
+    def __enter__(self) -> ParquetFile: ...
+    def __exit__(self, *args: Any) -> None: ...
+    @property
+    def metadata(self) -> FileMetaData: ...
+    def iter_batches(
+        self,
+        batch_size: int = 65536,
+        row_groups: list | None = None,
+        columns: list | None = None,
+        use_threads: bool = True,
+        use_pandas_metadata: bool = False,
+    ) -> Iterator[RecordBatch]: ...
+    def read(
+        self,
+        columns: list | None = None,
+        use_threads: bool = True,
+        use_pandas_metadata: bool = False,
+    ) -> Table: ...
 
 def read_table(
     source: str | NativeFile | BinaryIO,
@@ -8,7 +8,14 @@ def is_boolean(t: DataType) -> bool: ...
 def is_integer(t: DataType) -> bool: ...
 def is_floating(t: DataType) -> bool: ...
 def is_decimal(t: DataType) -> bool: ...
+def is_dictionary(t: DataType) -> bool: ...
 def is_temporal(t: DataType) -> bool: ...
+def is_string(t: DataType) -> bool: ...
+def is_large_string(t: DataType) -> bool: ...
+def is_binary(t: DataType) -> bool: ...
+def is_large_binary(t: DataType) -> bool: ...
+def is_fixed_size_binary(t: DataType) -> bool: ...
+def is_binary_view(t: DataType) -> bool: ...
 def is_date(t: DataType) -> bool: ...
 def is_time(t: DataType) -> bool: ...
 def is_timestamp(t: DataType) -> bool: ...
@@ -5,6 +5,7 @@ from pathlib import Path
 from typing import Sequence
 
 import pyarrow as pa
+import pytest
 from textual_fastdatatable import ArrowBackend
 
 
@@ -15,6 +16,14 @@ def test_from_records(records: list[tuple[str | int, ...]]) -> None:
     assert tuple(backend.columns) == records[0]
 
 
+def test_from_records_columns(records: list[tuple[str | int, ...]]) -> None:
+    backend = ArrowBackend.from_records(
+        records, has_header=True, columns=["three", "first column"]
+    )
+    assert tuple(backend.columns) == ("three", "first column")
+    assert backend.get_row_at(0) == ["foo", 1]
+
+
 def test_from_records_no_header(records: list[tuple[str | int, ...]]) -> None:
     backend = ArrowBackend.from_records(records[1:], has_header=False)
     assert backend.column_count == 3
@@ -22,6 +31,18 @@ def test_from_records_no_header(records: list[tuple[str | int, ...]]) -> None:
     assert tuple(backend.columns) == ("f0", "f1", "f2")
 
 
+def test_from_records_ragged() -> None:
+    records = [("a", "b", "c"), (1, "x", True), (2, "y"), (3, "z", False, "extra")]
+    backend = ArrowBackend.from_records(records, has_header=True)
+    assert tuple(backend.columns) == ("a", "b", "c")
+    assert backend.get_column_at(2) == [True, None, False]
+
+    records = [("a", "b", "c"), (1, 2), (3, 4)]
+    backend = ArrowBackend.from_records(records, has_header=True)
+    assert tuple(backend.columns) == ("a", "b", "c")
+    assert backend.get_column_at(2) == [None, None]
+
+
 def test_from_pydict(pydict: dict[str, Sequence[str | int]]) -> None:
     backend = ArrowBackend.from_pydict(pydict)
     assert backend.column_count == 3
@@ -30,6 +51,27 @@ def test_from_pydict(pydict: dict[str, Sequence[str | int]]) -> None:
     assert tuple(backend.columns) == tuple(pydict.keys())
 
 
+def test_from_pydict_types() -> None:
+    data: dict[str, list] = {
+        "ints_and_floats": [None, 1, 2.5],
+        "floats_and_ints": [1.5, None, 2],
+        "strs": [None, "a", "b"],
+        "bools": [True, False, None],
+        "strs_and_bytes": ["x", None, b"y"],
+        "floats_and_bools": [1.5, True, None],
+    }
+    backend = ArrowBackend.from_pydict(data)
+    assert [arr.type for arr in backend.data.columns] == [
+        pa.float64(),
+        pa.float64(),
+        pa.string(),
+        pa.bool_(),
+        pa.binary(),
+        pa.float64(),
+    ]
+    assert backend.get_column_at(0) == [None, 1.0, 2.5]
+
+
 def test_from_pydict_with_limit(pydict: dict[str, Sequence[str | int]]) -> None:
     backend = ArrowBackend.from_pydict(pydict, max_rows=2)
     assert backend.column_count == 3
@@ -47,6 +89,62 @@ def test_from_parquet(pydict: dict[str, Sequence[str | int]], tmp_path: Path) ->
     assert backend.data.equals(tbl)
 
 
+def test_from_parquet_columns(
+    pydict: dict[str, Sequence[str | int]], tmp_path: Path
+) -> None:
+    tbl = pa.Table.from_pydict(pydict)
+    p = tmp_path / "test.parquet"
+    pa.parquet.write_table(tbl, str(p))
+
+    backend = ArrowBackend.from_parquet(p, columns=["three", "two"])
+    assert tuple(backend.columns) == ("three", "two")
+    assert backend.data.equals(tbl.select(["three", "two"]))
+
+
+def test_from_parquet_native_file(
+    pydict: dict[str, Sequence[str | int]], tmp_path: Path
+) -> None:
+    tbl = pa.Table.from_pydict(pydict)
+    p = tmp_path / "test.parquet"
+    pa.parquet.write_table(tbl, str(p))
+
+    with pa.memory_map(str(p)) as source:
+        backend = ArrowBackend.from_parquet(source)
+    assert backend.data.equals(tbl)
+
+
+def test_from_parquet_max_rows(
+    pydict: dict[str, Sequence[str | int]], tmp_path: Path
+) -> None:
+    tbl = pa.Table.from_pydict(pydict)
+    p = tmp_path / "test.parquet"
+    pa.parquet.write_table(tbl, str(p), row_group_size=2)
+
+    backend = ArrowBackend.from_parquet(p, max_rows=3, columns=["two"])
+    assert backend.row_count == 3
+    assert backend.source_row_count == 5
+    assert backend.data.equals(tbl.select(["two"]).slice(0, 3))
+
+    empty = tmp_path / "empty.parquet"
+    pa.parquet.write_table(tbl.slice(0, 0), str(empty))
+    backend = ArrowBackend.from_parquet(empty, max_rows=3)
+    assert backend.row_count == 0
+    assert tuple(backend.columns) == tuple(tbl.column_names)
+
+
+def test_from_parquet_buffer_size(
+    pydict: dict[str, Sequence[str | int]], tmp_path: Path
+) -> None:
+    tbl = pa.Table.from_pydict(pydict)
+    p = tmp_path / "test.parquet"
+    pa.parquet.write_table(tbl, str(p))
+
+    backend = ArrowBackend.from_parquet(p, buffer_size=1 << 20)
+    assert backend.data.equals(tbl)
+    backend = ArrowBackend.from_parquet(p, max_rows=2, buffer_size=1 << 20)
+    assert backend.data.equals(tbl.slice(0, 2))
+
+
 def test_empty_query() -> None:
     data: dict[str, list] = {"a": []}
     backend = ArrowBackend.from_pydict(data)
@@ -60,6 +158,46 @@ def test_dupe_column_labels() -> None:
     assert backend.column_count == 3
     assert backend.row_count == 4
     assert backend.get_row_at(2) == [2, 2, 2]
+    assert list(backend.columns) == ["a", "a0", "a01"]
+
+
+def test_append_rows_combines_chunks() -> None:
+    backend = ArrowBackend.from_pydict({"a": [0], "b": ["0"]})
+    for i in range(1, 200):
+        backend.append_rows([(i, str(i))])
+    for _ in range(100):
+        backend.drop_row(50)
+    for i in range(100):
+        backend.update_cell(i, 1, "x")
+    assert all(col.num_chunks <= 65 for col in backend.data.itercolumns())
+    assert backend.row_count == 100
+    assert backend.get_column_at(0) == [*range(50), *range(150, 200)]
+    assert backend.get_column_at(1) == ["x"] * 100
+
+
+def test_negative_column_index_cache() -> None:
+    backend = ArrowBackend.from_pydict({"a": [1, 2, 3], "b": ["x", "y", "z"]})
+    assert backend.get_column_at(-1) == ["x", "y", "z"]
+    assert backend.get_cell_at(0, -1) == "x"
+    backend.update_cell(0, 1, "CHANGED")
+    assert backend.get_column_at(-1) == ["CHANGED", "y", "z"]
+    assert backend.get_cell_at(0, -1) == "CHANGED"
+    backend.update_cell(1, -1, "AGAIN")
+    assert backend.get_column_at(1) == ["CHANGED", "AGAIN", "z"]
+    backend.append_column("c")
+    assert backend.get_column_at(-1) == [None, None, None]
+    with pytest.raises(IndexError):
+        backend.get_column_at(-4)
+    with pytest.raises(IndexError):
+        backend.update_cell(0, 3, "nope")
+
+
+def test_columns_after_append_column() -> None:
+    backend = ArrowBackend.from_pydict({"a": [1, 2]})
+    assert list(backend.columns) == ["a"]
+    backend.append_column("b")
+    assert list(backend.columns) == ["a", "b"]
+    assert backend.column_count == 2
 
 
 def test_timestamp_with_tz() -> None:
@@ -92,3 +230,117 @@ def test_negative_timestamps() -> None:
     assert backend.get_column_at(0) == [None, None, None]
     assert backend.get_row_at(0) == [None]
     assert backend.get_cell_at(0, 0) is None
+
+
+def test_drop_middle_row(pydict: dict[str, Sequence[str | int]]) -> None:
+    backend = ArrowBackend.from_pydict(pydict)
+    backend.drop_row(2)
+    assert backend.row_count == 4
+    assert backend.get_column_at(0) == [1, 2, 4, 5]
+    assert backend.get_row_at(2) == [4, "d", "qux"]
+
+
+def test_update_cell_null_column() -> None:
+    tab = pa.table([pa.nulls(3)], names=["empty"])
+    backend = ArrowBackend(data=tab)
+    backend.update_cell(1, 0, "foo")
+    assert backend.data.column(0).type == pa.string()
+    assert backend.get_column_at(0) == [None, "foo", None]
+    backend.update_cell(-1, 0, "bar")
+    assert backend.get_column_at(0) == [None, "foo", "bar"]
+    with pytest.raises(IndexError):
+        backend.update_cell(3, 0, "baz")
+
+
+def test_nested_column_widths() -> None:
+    tab = pa.table(
+        {
+            "lists": pa.array([[1, 2], None, [3]]),
+            "structs": pa.array([{"a": 1}, {"a": 22}, None]),
+        }
+    )
+    backend = ArrowBackend(data=tab)
+    assert backend.column_content_widths == [6, 9]
+
+
+def test_dictionary_column_widths() -> None:
+    arr = pa.chunked_array(
+        [
+            pa.array(["a", "bbb", None]).dictionary_encode(),
+            pa.array(["cccc"]).dictionary_encode(),
+        ]
+    )
+    tab = pa.table(
+        {"strings": arr, "ints": pa.array([1, 22, 3, 4]).dictionary_encode()}
+    )
+    backend = ArrowBackend(data=tab)
+    assert backend.column_content_widths == [4, 2]
+
+
+def test_wide_character_widths() -> None:
+    tab = pa.table({"names": ["abcde", "日本語", None], "cjk": ["日本語", "a", "b"]})
+    backend = ArrowBackend(data=tab)
+    assert backend.column_content_widths == [6, 6]
+
+
+def test_string_widths_longest_by_bytes_is_not_widest() -> None:
+    tab = pa.table(
+        {
+            "ascii_wider": ["日本語日本", "abcdefghijk", "a"],
+            "cjk_wider": ["abcdefghijk", "日本語日本語日本語", None],
+            "ascii": ["abc", "abcdef", ""],
+            "empty": ["", None, ""],
+        }
+    )
+    backend = ArrowBackend(data=tab)
+    assert backend.column_content_widths == [11, 18, 6, 0]
+
+
+def test_binary_column_widths() -> None:
+    tab = pa.table(
+        {
+            "invalid_utf8": pa.array([b"ab", b"\xff\xfe\xfd"]),
+            "large": pa.array([b"abc", None], type=pa.large_binary()),
+        }
+    )
+    backend = ArrowBackend(data=tab)
+    # binary values are rendered with str()
+    assert backend.column_content_widths == [
+        len(str(b"\xff\xfe\xfd")),
+        len(str(b"abc")),
+    ]
+
+
+def test_binary_column_widths_with_partial_utf8() -> None:
+    # a valid wide character followed by an invalid byte
+    value = b"\xe6\x97\xa5\xff"
+    tab = pa.table(
+        {
+            "binary": pa.array([value]),
+            "fixed_size": pa.array([value], type=pa.binary(4)),
+            "view": pa.array([value], type=pa.binary_view()),
+        }
+    )
+    backend = ArrowBackend(data=tab)
+    assert backend.column_content_widths == [len(str(value))] * 3
+
+
+def test_numeric_column_widths_with_nulls() -> None:
+    tab = pa.table(
+        {
+            "some_nulls": pa.array([None, 123, None], type=pa.int64()),
+            "all_nulls": pa.array([None, None, None], type=pa.float64()),
+        }
+    )
+    backend = ArrowBackend(data=tab)
+    assert backend.column_content_widths == [3, 0]
+
+
+def test_empty_table_widths() -> None:
+    tab = pa.table(
+        {"flag": pa.array([], type=pa.bool_()), "name": pa.array([], pa.string())}
+    )
+    backend = ArrowBackend(data=tab)
+    assert backend.column_content_widths == [0, 0]
+    backend.append_rows([(True, "abc")])
+    assert backend.column_content_widths == [7, 3]
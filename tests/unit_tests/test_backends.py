@@ -1,7 +1,16 @@
 from __future__ import annotations
 
+import gc
+import weakref
+
+import polars as pl
+import pyarrow.lib as pal
 import pytest
-from textual_fastdatatable.backend import DataTableBackend
+from textual_fastdatatable.backend import (
+    ArrowBackend,
+    DataTableBackend,
+    PolarsBackend,
+)
 
 
 def test_column_content_widths(backend: DataTableBackend) -> None:
@@ -25,6 +34,27 @@ def test_get_column_at(backend: DataTableBackend) -> None:
         backend.get_column_at(10)
 
 
+def test_get_column_at_after_mutation(backend: DataTableBackend) -> None:
+    column = backend.get_column_at(0)
+    assert isinstance(column, list)
+    column[0] = 100
+    assert backend.get_column_at(0) == [1, 2, 3, 4, 5]
+
+    backend.update_cell(0, 0, 0)
+    assert backend.get_column_at(0) == [0, 2, 3, 4, 5]
+    backend.drop_row(4)
+    assert backend.get_column_at(0) == [0, 2, 3, 4]
+    backend.append_rows([(6, "b", "bar")])
+    assert backend.get_column_at(0) == [0, 2, 3, 4, 6]
+
+
+def test_update_cell_negative_column_index(backend: DataTableBackend) -> None:
+    assert backend.get_column_at(2) == ["foo", "bar", "baz", "qux", "foofoo"]
+    backend.update_cell(0, -1, "CHANGED")
+    assert backend.get_column_at(2) == ["CHANGED", "bar", "baz", "qux", "foofoo"]
+    assert backend.get_cell_at(0, 2) == "CHANGED"
+
+
 def test_get_cell_at(backend: DataTableBackend) -> None:
     assert backend.get_cell_at(0, 0) == 1
     assert backend.get_cell_at(4, 1) == "asdfasdf"
@@ -34,6 +64,14 @@ def test_get_cell_at(backend: DataTableBackend) -> None:
         backend.get_cell_at(0, 10)
 
 
+def test_get_cell_at_cached_column(backend: DataTableBackend) -> None:
+    backend.get_column_at(1)
+    assert backend.get_cell_at(4, 1) == "asdfasdf"
+    assert backend.get_row_at(4) == [5, "asdfasdf", "foofoo"]
+    with pytest.raises(IndexError):
+        backend.get_cell_at(10, 1)
+
+
 def test_append_column(backend: DataTableBackend) -> None:
     original_table = backend.data
     backend.append_column("new")
@@ -79,6 +117,55 @@ def test_drop_row(backend: DataTableBackend) -> None:
         backend.drop_row(3)
 
 
+def test_content_widths_after_append_and_drop(backend: DataTableBackend) -> None:
+    assert backend.column_content_widths == [1, 8, 6]
+    backend.append_rows([(6, "abcdefghij", "x")])
+    assert backend.column_content_widths == [1, 10, 6]
+    backend.drop_row(0)
+    assert backend.column_content_widths == [1, 10, 6]
+    backend.drop_row(4)
+    assert backend.column_content_widths == [1, 8, 6]
+
+
+def test_drop_row_keeps_fixed_content_widths(backend: DataTableBackend) -> None:
+    assert isinstance(backend, (ArrowBackend, PolarsBackend))
+    backend = type(backend).from_pydict(
+        {
+            "flag": [True, False, True],
+            "nothing": [None, None, None],
+            "text": ["a", "bb", "ccc"],
+        }
+    )
+    widths = backend.column_content_widths
+    assert widths[0] == 7 and widths[2] == 3
+    backend.drop_row(0)
+    # nothing in the dropped row was the widest value, so the widths are kept
+    assert backend._column_content_widths == widths
+    backend.drop_row(1)
+    assert backend.column_content_widths == [*widths[:2], 2]
+
+
+def test_sort_does_not_keep_replaced_data(backend: DataTableBackend) -> None:
+    backend.sort("two")
+    sorted_data = weakref.ref(backend.data)
+    backend.update_cell(0, 1, "changed")
+    gc.collect()
+    assert sorted_data() is None
+    backend.sort("two")
+    assert backend.get_column_at(1) == ["asdfasdf", "b", "c", "changed", "d"]
+
+
+def test_sort_missing_column(backend: DataTableBackend) -> None:
+    # small tables are still checked for the sort key
+    while backend.row_count > 1:
+        backend.drop_row(0)
+    with pytest.raises((pal.ArrowInvalid, pl.exceptions.ColumnNotFoundError)):
+        backend.sort("nonexistent")
+    backend.drop_row(0)
+    with pytest.raises((pal.ArrowInvalid, pl.exceptions.ColumnNotFoundError)):
+        backend.sort([("nonexistent", "descending")])
+
+
 def test_update_cell(backend: DataTableBackend) -> None:
     backend.update_cell(0, 0, 0)
     assert backend.get_column_at(0) == [0, 2, 3, 4, 5]
@@ -107,3 +194,15 @@ def test_sort(backend: DataTableBackend) -> None:
 
     backend.sort(by=[("first column", "ascending")])
     assert backend.data.equals(original_table)
+
+
+def test_sort_twice(backend: DataTableBackend) -> None:
+    backend.sort(by="two")
+    sorted_table = backend.data
+    backend.sort(by="two")
+    assert backend.data is sorted_table
+
+    backend.update_cell(0, 1, "zzz")
+    backend.sort(by="two")
+    assert backend.data is not sorted_table
+    assert backend.get_cell_at(backend.row_count - 1, 1) == "zzz"
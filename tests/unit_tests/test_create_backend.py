@@ -1,4 +1,8 @@
-from textual_fastdatatable.backend import create_backend
+import subprocess
+import sys
+
+import polars as pl
+from textual_fastdatatable.backend import PolarsBackend, create_backend
 
 
 def test_empty_sequence() -> None:
@@ -8,3 +12,14 @@ def test_empty_sequence() -> None:
     assert backend.column_count == 0
     assert backend.columns == []
     assert backend.column_content_widths == []
+
+
+def test_polars_dataframe() -> None:
+    backend = create_backend(data=pl.DataFrame({"a": [1, 2, 3]}))
+    assert isinstance(backend, PolarsBackend)
+    assert backend.row_count == 3
+
+
+def test_polars_not_imported() -> None:
+    code = "import sys, textual_fastdatatable; assert 'polars' not in sys.modules"
+    subprocess.run([sys.executable, "-c", code], check=True)
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import locale
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+import pytest
+from rich.console import Console
+from textual_fastdatatable.formatter import measure_width
+
+
+def test_measure_width_equal_values_render_differently() -> None:
+    console = Console()
+    assert measure_width(Decimal("1.0"), console) == 3
+    assert measure_width(Decimal("1.00000"), console) == 7
+    assert measure_width(0.0, console) == 1
+    assert measure_width(-0.0, console) == 2
+    utc = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    other = utc.astimezone(timezone(timedelta(hours=5)))
+    assert measure_width(utc, console) == 24
+    assert measure_width(other, console) == 29
+    assert measure_width(1, console) == 1
+    assert measure_width(True, console) == 7
+
+
+def test_measure_width_depends_on_console_width() -> None:
+    console = Console(width=5)
+    assert measure_width("abcdefghij", console) == 5
+    console.width = 80
+    assert measure_width("abcdefghij", console) == 10
+
+
+def test_measure_width_depends_on_locale() -> None:
+    console = Console()
+    original = locale.setlocale(locale.LC_NUMERIC)
+    try:
+        try:
+            locale.setlocale(locale.LC_NUMERIC, "en_US.UTF-8")
+        except locale.Error:
+            pytest.skip("en_US.UTF-8 locale is not available")
+        assert measure_width(1234567, console) == 9
+        locale.setlocale(locale.LC_NUMERIC, "C")
+        assert measure_width(1234567, console) == 7
+    finally:
+        locale.setlocale(locale.LC_NUMERIC, original)